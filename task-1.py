@@ -1,24 +1,78 @@
+import atexit
+import os
+import sys
 import uuid
 from datetime import datetime
 import csv
-from collections import deque
+from itertools import groupby
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None  # Optional: vectorized CSV loading; the csv module path still works
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None  # Optional: compiled CSR pathfinding; pure-Python BFS still works
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _bfs_csr(indptr, indices, edge_lines, origin_idx, destination_idx):
+        """Compiled BFS over a CSR adjacency; returns parent/parent-line arrays.
+
+        parent[idx] is -2 for unvisited nodes, -1 for the origin, otherwise
+        the index of the node it was discovered from.
+        """
+        n = indptr.shape[0] - 1
+        parent = np.full(n, -2, np.int32)
+        parent_line = np.full(n, -1, np.int32)
+        queue = np.empty(n, np.int32)
+        head = 0
+        tail = 1
+        queue[0] = origin_idx
+        parent[origin_idx] = -1
+
+        while head < tail:
+            current = queue[head]
+            head += 1
+            if current == destination_idx:
+                break
+            for e in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[e]
+                if parent[neighbor] == -2:
+                    parent[neighbor] = current
+                    parent_line[neighbor] = edge_lines[e]
+                    queue[tail] = neighbor
+                    tail += 1
+
+        return parent, parent_line
 
 class Station:
+    __slots__ = ('id', 'name', 'lines', '_lines_set', 'lines_set', 'idx')
+
     def __init__(self, id, name):
         self.id = id
         self.name = name
-        self.lines = []
+        self.lines = []           # Ordered list of Line objects
+        self._lines_set = set()   # Line IDs, for O(1) membership checks
+        self.lines_set = frozenset()  # Line objects, precomputed after loading
+        self.idx = None           # Dense index assigned by MetroSystem._build_graph
 
     def __str__(self):
         return self.name
-    
+
     def __repr__(self):
         return f"Station({self.id}, {self.name})"
 
     def join_line(self, line):
         """Accept a line object and add this station to that line"""
-        if line not in self.lines:
+        if line.id not in self._lines_set:
             self.lines.append(line)
+            self._lines_set.add(line.id)
             return self.lines
         else:
             return None
@@ -36,19 +90,28 @@ class Station:
 
 
 class Ticket:
-    def __init__(self, origin, destination, price, route_info, misc=""):
-        self.id = self._generate_id()
+    __slots__ = ('id', 'origin', 'destination', 'price', 'route_info',
+                 'timestamp', 'misc')
+
+    def __init__(self, origin, destination, price, route_info, misc="", timestamp=None):
+        self.timestamp = timestamp if timestamp is not None else datetime.now()
+        self.id = self._generate_id(self.timestamp)
         self.origin = origin
         self.destination = destination
         self.price = price
         self.route_info = route_info
-        self.timestamp = datetime.now()
         self.misc = misc
 
-    def _generate_id(self):
+    def _generate_id(self, timestamp):
+        unique_id = uuid.uuid4().hex[:8]  # hex is already a str, no conversion needed
+        return f"MET-TKT-{timestamp.strftime('%Y%m%d-%H%M%S')}-{unique_id}"
+
+    @classmethod
+    def generate_ids_bulk(cls, n):
+        """Yield n ticket IDs sharing a single timestamp read"""
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        unique_id = str(uuid.uuid4())[:8]
-        return f"MET-TKT-{timestamp}-{unique_id}"
+        for _ in range(n):
+            yield f"MET-TKT-{timestamp}-{uuid.uuid4().hex[:8]}"
 
     def display(self):
         """Display formatted ticket information"""
@@ -73,45 +136,43 @@ class Ticket:
 
 
 class Line:
+    __slots__ = ('id', 'name', 'colour', 'stations', '_stations_set',
+                 '_pos', 'idx')
+
     def __init__(self, id, name, colour):
         self.id = id
         self.name = name
         self.colour = colour
-        self.stations = []  # Ordered list of Station objects
+        self.stations = []        # Ordered list of Station objects
+        self._stations_set = set()  # Station IDs, for O(1) membership checks
+        self._pos = {}    # {Station object: position on line}
+        self.idx = None           # Dense index assigned by MetroSystem._build_graph
 
     def get_station_position(self, station):
         """Get the index position of a station on this line"""
-        try:
-            return self.stations.index(station)
-        except ValueError:
-            return None
+        return self._pos.get(station)
 
     def stations_on_line(self, station_list):
         """Check if all stations in list exist on this line"""
-        for station in station_list:
-            if station not in self.stations:
-                return False
-        return True
+        return all(station.id in self._stations_set for station in station_list)
 
     def calculate_distance(self, origin, destination):
         """Calculate number of stations between origin and destination"""
-        if self.stations_on_line([origin, destination]):
-            try:
-                origin_idx = self.stations.index(origin)
-                destination_idx = self.stations.index(destination)
-                return abs(destination_idx - origin_idx)
-            except ValueError:
-                return None
-        return None
+        origin_idx = self._pos.get(origin)
+        destination_idx = self._pos.get(destination)
+        if origin_idx is None or destination_idx is None:
+            return None
+        return abs(destination_idx - origin_idx)
 
     def add_station(self, station):
         """Add a station to this line (creates bidirectional relationship)"""
-        if station not in self.stations:
+        if station.id not in self._stations_set:
             self.stations.append(station)
+            self._stations_set.add(station.id)
+            self._pos[station] = len(self.stations) - 1
             station.join_line(self)
 
     def __str__(self):
-        station_names = [s.name for s in self.stations]
         return f"Line: {self.name} ({self.colour}) - {len(self.stations)} stations"
     
     def __repr__(self):
@@ -123,11 +184,26 @@ class MetroSystem:
         self.stations = {}  # {station_id: Station object}
         self.lines = {}     # {line_id: Line object}
         self.tickets = []   # List of Ticket objects
-        self.graph = {}     # Adjacency list for pathfinding
+        self.edge_line = {} # {frozenset((station_id, station_id)): Line}
+
+        # Dense graph representation built by _build_graph:
+        # stations/lines in index order plus an integer adjacency list
+        self.stations_by_idx = []
+        self.lines_by_idx = []
+        self.adj = []       # adj[station_idx] = [(neighbor_idx, line_idx), ...]
         
         # Pricing configuration
         self.BASE_FARE = 10
         self.FARE_PER_STATION = 5
+
+        # Persistent append handle for the tickets CSV, opened lazily on
+        # first save so each purchase avoids an open/stat/close round trip
+        self._tickets_fh = None
+        self._tickets_writer = None
+
+        # Pending ticket rows, flushed in batches to amortize write syscalls
+        self._ticket_write_buffer = []
+        self.TICKET_FLUSH_THRESHOLD = 64
     
     # ============================================
     # DATA LOADING
@@ -144,56 +220,136 @@ class MetroSystem:
     
     def _load_stations(self, filepath):
         """Load stations from CSV file"""
-        with open(filepath, 'r', newline='') as station_csv:
-            reader = csv.reader(station_csv, delimiter=';')
-            next(reader)  # Skip header
-            for line in reader:
-                station_id = line[0].strip()
+        if pd is not None:
+            # Vectorized read: one C-level parse plus column-wise strips
+            df = pd.read_csv(filepath, sep=';', dtype=str).fillna('')
+            station_ids = df.iloc[:, 0].str.strip()
+            station_names = df.iloc[:, 1].str.strip()
+            for station_id, station_name in zip(station_ids, station_names):
+                # Interned IDs share one string object per station, so later
+                # dict lookups hit the pointer-identity fast path
+                station_id = sys.intern(station_id)
+                self.stations[station_id] = Station(station_id, station_name)
+            return
+
+        # The data files carry no quoted or escaped fields, so a plain
+        # split per line beats csv.reader's per-row machinery
+        with open(filepath, 'r') as station_csv:
+            next(station_csv)  # Skip header
+            for raw in station_csv:
+                line = raw.rstrip('\r\n').split(';')
+                station_id = sys.intern(line[0].strip())
                 station_name = line[1].strip()
                 station = Station(station_id, station_name)
                 self.stations[station_id] = station
 
     def _load_lines(self, filepath):
         """Load lines from CSV and connect stations"""
-        with open(filepath, 'r', newline='') as lines_csv:
-            reader = csv.reader(lines_csv, delimiter=';')
-            next(reader)  # Skip header
-            for l in reader:
-                line_id = l[0].strip()
-                line_name = l[1].strip()
-                line_colour = l[2].strip()
-                stations_in_order = [s.strip() for s in l[3].split(',')]
+        if pd is not None:
+            # Strip and split column-wise in one vectorized pass each
+            df = pd.read_csv(filepath, sep=';', dtype=str).fillna('')
+            line_ids = df.iloc[:, 0].str.strip()
+            line_names = df.iloc[:, 1].str.strip()
+            line_colours = df.iloc[:, 2].str.strip()
+            rosters = df.iloc[:, 3].str.split(',')
 
+            for line_id, line_name, line_colour, roster in zip(
+                    line_ids, line_names, line_colours, rosters):
                 line = Line(line_id, line_name, line_colour)
-                
+
                 # Add stations in order
-                for station_id in stations_in_order:
+                for station_id in roster:
+                    station_id = sys.intern(station_id.strip())
                     if station_id in self.stations:
                         line.add_station(self.stations[station_id])
 
                 self.lines[line_id] = line
-    
+        else:
+            # Same unquoted-field assumption as the station loader
+            with open(filepath, 'r') as lines_csv:
+                next(lines_csv)  # Skip header
+                for raw in lines_csv:
+                    l = raw.rstrip('\r\n').split(';')
+                    line_id = l[0].strip()
+                    line_name = l[1].strip()
+                    line_colour = l[2].strip()
+                    stations_in_order = [sys.intern(s.strip()) for s in l[3].split(',')]
+
+                    line = Line(line_id, line_name, line_colour)
+
+                    # Add stations in order
+                    for station_id in stations_in_order:
+                        if station_id in self.stations:
+                            line.add_station(self.stations[station_id])
+
+                    self.lines[line_id] = line
+
+        # Precompute line sets so transfer checks avoid rebuilding sets per
+        # query; frozen because the network is static after loading
+        for station in self.stations.values():
+            station.lines_set = frozenset(station.lines)
+
     def _build_graph(self):
         """Build adjacency list representation for pathfinding"""
-        # Initialize graph
-        for station_id in self.stations:
-            self.graph[station_id] = []
-        
+        # Map stations and lines to dense integer indices so BFS works on
+        # small ints instead of hashing string IDs in its inner loop
+        self.stations_by_idx = list(self.stations.values())
+        for idx, station in enumerate(self.stations_by_idx):
+            station.idx = idx
+
+        self.lines_by_idx = list(self.lines.values())
+        for idx, line in enumerate(self.lines_by_idx):
+            line.idx = idx
+
+        self.adj = [[] for _ in self.stations_by_idx]
+
         # Add edges based on line connections
-        for line in self.lines.values():
+        for line in self.lines_by_idx:
             for i in range(len(line.stations) - 1):
                 station1 = line.stations[i]
                 station2 = line.stations[i + 1]
-                
+
                 # Add bidirectional edges
-                self.graph[station1.id].append({
-                    'station': station2,
-                    'line': line
-                })
-                self.graph[station2.id].append({
-                    'station': station1,
-                    'line': line
-                })
+                self.adj[station1.idx].append((station2.idx, line.idx))
+                self.adj[station2.idx].append((station1.idx, line.idx))
+
+                # Remember which line serves this edge so route generation
+                # never has to intersect station line sets per query
+                self.edge_line[frozenset((station1.id, station2.id))] = line
+
+        # Fares indexed by distance; no path can exceed the station count
+        self._fare_table = tuple(
+            self.BASE_FARE + d * self.FARE_PER_STATION
+            for d in range(len(self.stations) + 1)
+        )
+
+        # Flatten the adjacency into CSR arrays for the compiled BFS kernel:
+        # neighbors of node i live in indices[indptr[i]:indptr[i+1]]
+        self._csr_indptr = None
+        if njit is not None:
+            indptr = [0]
+            flat_indices = []
+            flat_edge_lines = []
+            for neighbors in self.adj:
+                for neighbor_idx, line_idx in neighbors:
+                    flat_indices.append(neighbor_idx)
+                    flat_edge_lines.append(line_idx)
+                indptr.append(len(flat_indices))
+            self._csr_indptr = np.asarray(indptr, dtype=np.int32)
+            self._csr_indices = np.asarray(flat_indices, dtype=np.int32)
+            self._csr_edge_lines = np.asarray(flat_edge_lines, dtype=np.int32)
+
+        # Scratch buffers reused by every _find_shortest_path call; only the
+        # entries touched by the previous query (tracked in _bfs_dirty) are
+        # reset, so repeated queries allocate nothing of O(V) size
+        n = len(self.stations_by_idx)
+        self._bfs_visited_fwd = bytearray(n)
+        self._bfs_visited_bwd = bytearray(n)
+        self._bfs_parent_fwd = [(-1, -1)] * n
+        self._bfs_parent_bwd = [(-1, -1)] * n
+        self._bfs_dist_fwd = [0] * n
+        self._bfs_dist_bwd = [0] * n
+        self._bfs_dirty = []
     
     def _load_tickets(self, filepath):
         """Load existing tickets from CSV"""
@@ -201,20 +357,26 @@ class MetroSystem:
             with open(filepath, 'r', newline='') as tickets_csv:
                 reader = csv.reader(tickets_csv, delimiter=";")
                 next(reader)  # Skip header
+
+                # One clock read for the whole batch; stored tickets already
+                # carry their IDs so _generate_id is bypassed entirely
+                loaded_at = datetime.now()
+
                 for l in reader:
                     if len(l) >= 5:
                         ticket_id, origin_id, dest_id, price, route_info = l[:5]
                         misc = l[5] if len(l) > 5 else ""
-                        
-                        # Reconstruct ticket (simplified version)
+
+                        # Only resolve the stations here; the Ticket object
+                        # itself is built lazily by _materialize_ticket when
+                        # a view actually needs it
                         origin = self.stations.get(origin_id.strip())
                         destination = self.stations.get(dest_id.strip())
-                        
+
                         if origin and destination:
-                            instructions = route_info.split('|')
-                            ticket = Ticket(origin, destination, float(price), instructions, misc)
-                            ticket.id = ticket_id  # Use stored ID
-                            self.tickets.append(ticket)
+                            self.tickets.append(
+                                (ticket_id, origin, destination, price,
+                                 route_info, misc, loaded_at))
         except FileNotFoundError:
             print("No existing tickets file found. Starting fresh.")
     
@@ -239,13 +401,13 @@ class MetroSystem:
             return None, "Error: Origin and destination are the same"
         
         # Find shortest path
-        path, distance = self._find_shortest_path(origin, destination)
-        
+        path, distance, edge_lines = self._find_shortest_path(origin, destination)
+
         if not path:
             return None, "Error: No route found between stations"
-        
+
         # Generate route instructions
-        instructions = self._generate_route_instructions(path)
+        instructions = self._generate_route_instructions(path, edge_lines)
         
         # Calculate price
         price = self._calculate_price(distance)
@@ -266,134 +428,259 @@ class MetroSystem:
     def _find_shortest_path(self, origin, destination):
         """
         Find shortest path using BFS
-        Returns: (list of Station objects, distance) or (None, 0)
+        Returns: (list of Station objects, distance, list of Line objects per edge)
+        or (None, 0, None)
         """
-        queue = deque([(origin, [origin], 0)])  # (current_station, path, distance)
-        visited = {origin.id}
-        
-        while queue:
-            current, path, distance = queue.popleft()
-            
-            # Found destination
-            if current.id == destination.id:
-                return path, distance
-            
-            # Explore neighbors
-            for neighbor_info in self.graph[current.id]:
-                neighbor = neighbor_info['station']
-                
-                if neighbor.id not in visited:
-                    visited.add(neighbor.id)
-                    new_path = path + [neighbor]
-                    queue.append((neighbor, new_path, distance + 1))
-        
-        return None, 0  # No path found
+        n = len(self.stations_by_idx)
+        origin_idx = origin.idx
+        destination_idx = destination.idx
+        adj = self.adj
+
+        if origin_idx == destination_idx:
+            return [origin], 0, []
+
+        if self._csr_indptr is not None:
+            # Compiled kernel: the whole search runs as a tight integer loop
+            # over contiguous arrays, reconstruction stays in Python
+            parent, parent_line = _bfs_csr(
+                self._csr_indptr, self._csr_indices, self._csr_edge_lines,
+                origin_idx, destination_idx)
+            if parent[destination_idx] == -2:
+                return None, 0, None
+
+            path = []
+            edge_lines = []
+            current_idx = destination_idx
+            while current_idx != -1:
+                path.append(self.stations_by_idx[current_idx])
+                line_idx = parent_line[current_idx]
+                current_idx = parent[current_idx]
+                if line_idx != -1:
+                    edge_lines.append(self.lines_by_idx[line_idx])
+            path.reverse()
+            edge_lines.reverse()
+            return path, len(path) - 1, edge_lines
+
+        # Bidirectional BFS: search level-by-level from both ends, always
+        # expanding the smaller frontier, and meet in the middle. Explores
+        # roughly the square root of the nodes a one-sided BFS would visit.
+        # parent[idx] = (parent_idx, line_idx); everything is integer-indexed
+        # so the inner loop never hashes strings.
+        visited_fwd = self._bfs_visited_fwd
+        visited_bwd = self._bfs_visited_bwd
+        parent_fwd = self._bfs_parent_fwd
+        parent_bwd = self._bfs_parent_bwd
+        dist_fwd = self._bfs_dist_fwd
+        dist_bwd = self._bfs_dist_bwd
+
+        # Clear only what the previous query touched; parent/dist entries are
+        # never read unless the matching visited flag is set in this query
+        dirty = self._bfs_dirty
+        for idx in dirty:
+            visited_fwd[idx] = 0
+            visited_bwd[idx] = 0
+        dirty.clear()
+
+        visited_fwd[origin_idx] = 1
+        visited_bwd[destination_idx] = 1
+        parent_fwd[origin_idx] = (-1, -1)
+        parent_bwd[destination_idx] = (-1, -1)
+        dist_fwd[origin_idx] = 0
+        dist_bwd[destination_idx] = 0
+        dirty.append(origin_idx)
+        dirty.append(destination_idx)
+        frontier_fwd = [origin_idx]
+        frontier_bwd = [destination_idx]
+
+        meet_idx = -1
+        while frontier_fwd and frontier_bwd and meet_idx == -1:
+            forward = len(frontier_fwd) <= len(frontier_bwd)
+            if forward:
+                frontier, visited, parent, dist = \
+                    frontier_fwd, visited_fwd, parent_fwd, dist_fwd
+                other_visited, other_dist = visited_bwd, dist_bwd
+            else:
+                frontier, visited, parent, dist = \
+                    frontier_bwd, visited_bwd, parent_bwd, dist_bwd
+                other_visited, other_dist = visited_fwd, dist_fwd
+
+            # Expand one full level; the best meeting node in the first level
+            # that touches the other side lies on a shortest path
+            next_frontier = []
+            best_total = -1
+            for current_idx in frontier:
+                next_dist = dist[current_idx] + 1
+                for neighbor_idx, line_idx in adj[current_idx]:
+                    if not visited[neighbor_idx]:
+                        visited[neighbor_idx] = 1
+                        dirty.append(neighbor_idx)
+                        parent[neighbor_idx] = (current_idx, line_idx)
+                        dist[neighbor_idx] = next_dist
+                        if other_visited[neighbor_idx]:
+                            total = next_dist + other_dist[neighbor_idx]
+                            if best_total == -1 or total < best_total:
+                                best_total = total
+                                meet_idx = neighbor_idx
+                        else:
+                            next_frontier.append(neighbor_idx)
+
+            if forward:
+                frontier_fwd = next_frontier
+            else:
+                frontier_bwd = next_frontier
+
+        if meet_idx == -1:
+            return None, 0, None  # No path found
+
+        # Stitch the two halves together at the meeting node: walk forward
+        # parents back to the origin, then backward parents to the destination
+        path = []
+        edge_lines = []
+        current_idx = meet_idx
+        while current_idx != -1:
+            path.append(self.stations_by_idx[current_idx])
+            current_idx, line_idx = parent_fwd[current_idx]
+            if line_idx != -1:
+                edge_lines.append(self.lines_by_idx[line_idx])
+        path.reverse()
+        edge_lines.reverse()
+
+        current_idx, line_idx = parent_bwd[meet_idx]
+        while current_idx != -1:
+            path.append(self.stations_by_idx[current_idx])
+            edge_lines.append(self.lines_by_idx[line_idx])
+            current_idx, line_idx = parent_bwd[current_idx]
+
+        return path, len(path) - 1, edge_lines
     
-    def _generate_route_instructions(self, path):
+    def _generate_route_instructions(self, path, edge_lines):
         """
         Generate human-readable route instructions from path
         Returns: List of instruction strings
         """
         if len(path) < 2:
             return ["You are already at the destination"]
-        
+
+        # Each run of consecutive edges on the same line is one travel
+        # segment, so the instructions fall out of a single groupby pass
         instructions = []
-        current_line = None
         segment_start_idx = 0
-        
-        for i in range(len(path) - 1):
-            station1 = path[i]
-            station2 = path[i + 1]
-            
-            # Find connecting line
-            connecting_line = self._find_connecting_line(station1, station2)
-            
-            if connecting_line != current_line:
-                # Save previous segment
-                if current_line is not None:
-                    stops = i - segment_start_idx
-                    instructions.append(
-                        f"Travel {stops} stop(s) on {current_line.name} to {station1.name}"
-                    )
-                
-                # Start new segment
-                if current_line is None:
-                    instructions.append(f"Board {connecting_line.name} at {station1.name}")
-                else:
-                    instructions.append(f"Transfer to {connecting_line.name} at {station1.name}")
-                
-                current_line = connecting_line
-                segment_start_idx = i
-        
-        # Add final segment
-        final_stops = len(path) - 1 - segment_start_idx
-        instructions.append(
-            f"Travel {final_stops} stop(s) on {current_line.name} to {path[-1].name}"
-        )
-        
+
+        for line, run in groupby(edge_lines):
+            stops = sum(1 for _ in run)
+            boarding_station = path[segment_start_idx]
+
+            if segment_start_idx == 0:
+                instructions.append(f"Board {line.name} at {boarding_station.name}")
+            else:
+                instructions.append(f"Transfer to {line.name} at {boarding_station.name}")
+
+            segment_start_idx += stops
+            instructions.append(
+                f"Travel {stops} stop(s) on {line.name} to {path[segment_start_idx].name}"
+            )
+
         return instructions
     
     def _find_connecting_line(self, station1, station2):
         """Find which line connects two adjacent stations"""
-        common_lines = set(station1.lines) & set(station2.lines)
-        return list(common_lines)[0] if common_lines else None
+        return self.edge_line.get(frozenset((station1.id, station2.id)))
     
     def _calculate_price(self, distance):
         """Calculate ticket price based on distance"""
-        return self.BASE_FARE + (distance * self.FARE_PER_STATION)
+        return self._fare_table[distance]
     
     # ============================================
     # TICKET MANAGEMENT
     # ============================================
     
+    def _ensure_tickets_writer(self, filepath):
+        """Open the tickets CSV once and keep the handle for the process lifetime"""
+        if self._tickets_writer is None:
+            is_new_file = not os.path.exists(filepath) or os.path.getsize(filepath) == 0
+            self._tickets_fh = open(filepath, 'a', newline='', buffering=1 << 16)
+            self._tickets_writer = csv.writer(self._tickets_fh, delimiter=';')
+
+            # Write header if new file
+            if is_new_file:
+                self._tickets_writer.writerow(
+                    ['ticket_id', 'origin_id', 'destination_id', 'price', 'route_info', 'misc'])
+
+            # atexit runs handlers last-in first-out, so the buffer flush
+            # registered here happens before the close registered first
+            atexit.register(self._tickets_fh.close)
+            atexit.register(self._flush_ticket_buffer)
+        return self._tickets_writer
+
+    def _flush_ticket_buffer(self):
+        """Write all buffered ticket rows out in one batch"""
+        if self._ticket_write_buffer and self._tickets_writer is not None:
+            self._tickets_writer.writerows(self._ticket_write_buffer)
+            self._tickets_fh.flush()
+            self._ticket_write_buffer.clear()
+
     def _save_ticket_to_csv(self, ticket, filepath='./data/tickets.csv'):
-        """Save ticket to CSV file"""
+        """Save ticket to CSV file (buffered; flushed in batches)"""
         try:
-            # Check if file exists
-            try:
-                with open(filepath, 'r') as f:
-                    file_exists = True
-            except FileNotFoundError:
-                file_exists = False
-            
-            with open(filepath, 'a', newline='') as f:
-                writer = csv.writer(f, delimiter=';')
-                
-                # Write header if new file
-                if not file_exists:
-                    writer.writerow(['ticket_id', 'origin_id', 'destination_id', 'price', 'route_info', 'misc'])
-                
-                # Write ticket data
-                route_str = '|'.join(ticket.route_info)
-                writer.writerow([
-                    ticket.id,
-                    ticket.origin.id,
-                    ticket.destination.id,
-                    ticket.price,
-                    route_str,
-                    ticket.misc
-                ])
+            self._ensure_tickets_writer(filepath)
+
+            # Queue ticket data
+            route_str = '|'.join(ticket.route_info)
+            self._ticket_write_buffer.append([
+                ticket.id,
+                ticket.origin.id,
+                ticket.destination.id,
+                ticket.price,
+                route_str,
+                ticket.misc
+            ])
+            if len(self._ticket_write_buffer) >= self.TICKET_FLUSH_THRESHOLD:
+                self._flush_ticket_buffer()
         except Exception as e:
             print(f"Error saving ticket: {e}")
     
+    def _materialize_ticket(self, index):
+        """Build the Ticket object for a loaded history row on first use"""
+        entry = self.tickets[index]
+        if isinstance(entry, Ticket):
+            return entry
+
+        ticket_id, origin, destination, price, route_info, misc, loaded_at = entry
+        ticket = Ticket.__new__(Ticket)
+        ticket.id = ticket_id
+        ticket.origin = origin
+        ticket.destination = destination
+        ticket.price = float(price)
+        ticket.route_info = route_info.split('|')
+        ticket.timestamp = loaded_at
+        ticket.misc = misc
+
+        # Replace the raw row so repeat views reuse the object
+        self.tickets[index] = ticket
+        return ticket
+
     def view_all_tickets(self):
         """Display all purchased tickets"""
         if not self.tickets:
             print("\n❌ No tickets have been purchased yet.\n")
             return
-        
-        print(f"\n{'='*60}")
-        print(f"ALL PURCHASED TICKETS ({len(self.tickets)} total)")
-        print(f"{'='*60}\n")
-        
-        for i, ticket in enumerate(self.tickets, 1):
-            print(f"\n--- Ticket {i} ---")
-            print(ticket)
-    
+
+        # Build the whole listing in memory and emit it with one write
+        out = []
+        out.append(f"\n{'='*60}\n")
+        out.append(f"ALL PURCHASED TICKETS ({len(self.tickets)} total)\n")
+        out.append(f"{'='*60}\n\n")
+
+        for i in range(len(self.tickets)):
+            out.append(f"\n--- Ticket {i + 1} ---\n")
+            out.append(f"{self._materialize_ticket(i)}\n")
+
+        sys.stdout.write("".join(out))
+
     def view_ticket_details(self, index):
         """Display detailed view of a specific ticket"""
         if 0 <= index < len(self.tickets):
-            self.tickets[index].display()
+            self._materialize_ticket(index).display()
         else:
             print("Invalid ticket number")
     
@@ -403,27 +690,35 @@ class MetroSystem:
     
     def display_all_stations(self):
         """Display all stations grouped by line"""
-        print(f"\n{'='*60}")
-        print(f"{'METRO STATIONS':^60}")
-        print(f"{'='*60}\n")
-        
+        # One write syscall for the whole listing instead of one per station
+        out = []
+        append = out.append
+        append(f"\n{'='*60}\n")
+        append(f"{'METRO STATIONS':^60}\n")
+        append(f"{'='*60}\n\n")
+
         for line in self.lines.values():
-            print(f"{line.name} ({line.colour}):")
+            append(f"{line.name} ({line.colour}):\n")
             for station in line.stations:
                 transfer = " [TRANSFER]" if station.is_transfer_station() else ""
                 lines_str = ", ".join(station.get_line_names())
-                print(f"  {station.id:4s} - {station.name:30s} (Lines: {lines_str}){transfer}")
-            print()
-    
+                append(f"  {station.id:4s} - {station.name:30s} (Lines: {lines_str}){transfer}\n")
+            append("\n")
+
+        sys.stdout.write("".join(out))
+
     def display_all_lines(self):
         """Display all metro lines"""
-        print(f"\n{'='*60}")
-        print(f"{'METRO LINES':^60}")
-        print(f"{'='*60}\n")
-        
+        out = []
+        out.append(f"\n{'='*60}\n")
+        out.append(f"{'METRO LINES':^60}\n")
+        out.append(f"{'='*60}\n\n")
+
         for line in self.lines.values():
-            print(f"{line.id}: {line}")
-        print()
+            out.append(f"{line.id}: {line}\n")
+        out.append("\n")
+
+        sys.stdout.write("".join(out))
 
 
 # ============================================